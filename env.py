@@ -18,6 +18,10 @@ class EnvConfig:
     def AWS_REGION(self):
         return self.env("AWS_REGION", "us-west-1")
 
+    @property
+    def MAX_INFLIGHT(self):
+        return self.env.int("MAX_INFLIGHT", 64)
+
 
 env = EnvConfig()
 
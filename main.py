@@ -1,18 +1,410 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import boto3
-from typing import Any, Dict, Optional, List, Union
+import botocore.session
+import orjson
+from boto3.s3.transfer import TransferConfig
+from botocore.awsrequest import (
+    AWSHTTPConnection,
+    AWSHTTPConnectionPool,
+    AWSHTTPSConnection,
+    AWSHTTPSConnectionPool,
+)
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from functools import lru_cache, partial
+from itertools import batched
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    List,
+    Mapping,
+    TYPE_CHECKING,
+    Sequence,
+    TypedDict,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from fastmcp import FastMCP, Context
+from s3transfer.crt import (
+    BotocoreCRTCredentialsWrapper,
+    BotocoreCRTRequestSerializer,
+    CRTTransferManager,
+    create_s3_crt_client,
+)
 from env import env
 
-s3_client = boto3.client(
-    "s3",
+if TYPE_CHECKING:
+    from mypy_boto3_s3.client import S3Client
+    from mypy_boto3_s3.type_defs import CopySourceTypeDef, DeleteObjectsOutputTypeDef
+
+T = TypeVar("T")
+
+
+class FileEntry(TypedDict):
+    """One object in a list_bucket response."""
+
+    key: str
+    size: int
+    last_modified: str
+
+
+class ListBucketResponse(TypedDict):
+    """A successful list_bucket response."""
+
+    bucket: str
+    files: List[FileEntry]
+
+
+MiB = 1024 * 1024
+
+# Concurrent ranged GETs per get_object call.
+RANGE_GET_CONCURRENCY = 16
+
+# DeleteObjects accepts at most this many keys per request.
+DELETE_BATCH_SIZE = 1000
+
+# Lifecycle rule fields forwarded to S3; keys absent from the input are left
+# out rather than sent as None, which the API rejects.
+LIFECYCLE_RULE_KEYS = (
+    "ID",
+    "Status",
+    "Filter",
+    "Prefix",
+    "Transitions",
+    "Expiration",
+    "NoncurrentVersionExpiration",
+    "NoncurrentVersionTransitions",
+    "AbortIncompleteMultipartUpload",
+)
+
+# Shared success response, returned by reference from tools with nothing else to
+# report. Callers must never mutate it.
+_OK: Dict[str, Union[bool, str]] = {"success": True}
+
+# Field lookups for listing responses, done in C rather than per-item bytecode.
+_bucket_name = itemgetter("Name")
+_object_fields = itemgetter("Key", "Size", "LastModified")
+
+# Presigned URLs are reused for at most this many seconds, and requested
+# expiries are rounded up to a multiple of it so near-identical requests share
+# a cache entry.
+PRESIGN_WINDOW = 60
+
+# Parallel part requests per managed transfer.
+TRANSFER_CONCURRENCY = 32
+
+# Large parts and many workers keep the link busy on multi-GB files; the
+# default 8 MiB parts spend most of their time on per-request latency.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=64 * MiB,
+    multipart_chunksize=64 * MiB,
+    max_concurrency=TRANSFER_CONCURRENCY,
+    use_threads=True,
+    max_io_queue=1000,
+)
+
+# Throughput the CRT transfer client plans its connection count around, in
+# bytes per second (10 Gb/s).
+CRT_TARGET_THROUGHPUT = 10 * 1000**3 // 8
+
+# Errors S3 returns when a request is signed for the wrong region.
+REGION_MISMATCH_ERRORS = frozenset(
+    {"PermanentRedirect", "AuthorizationHeaderMalformed"}
+)
+
+# Used only for sources past CopyObject's 5 GiB limit, which it rejects. Managed
+# multipart copies drop the source's ContentType, Metadata and tags. Server-side
+# copies move no data through this process, so fewer workers suffice.
+COPY_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=64 * MiB,
+    multipart_chunksize=64 * MiB,
+    max_concurrency=16,
+)
+
+# Only the classic upload_file fallback for buckets outside AWS_REGION streams
+# file parts through urllib3; CRT uploads bypass it and put_object sends bytes
+# in one write. There, urllib3's 16 KiB reads and sends become 1 MiB ones, 64
+# instead of 4096 per 64 MiB part. Its pool manager always passes a blocksize,
+# so the override patches botocore's connection classes for the whole process.
+SEND_BLOCKSIZE = 1 * MiB
+
+
+class _HTTPConnection(AWSHTTPConnection):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["blocksize"] = SEND_BLOCKSIZE
+        super().__init__(*args, **kwargs)
+
+
+class _HTTPSConnection(AWSHTTPSConnection):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["blocksize"] = SEND_BLOCKSIZE
+        super().__init__(*args, **kwargs)
+
+
+AWSHTTPConnectionPool.ConnectionCls = _HTTPConnection
+AWSHTTPSConnectionPool.ConnectionCls = _HTTPSConnection
+
+# Caps concurrent S3 calls, and with them the busy worker threads and their
+# clients' connections, so bursts of tool calls queue here instead.
+MAX_INFLIGHT = env.MAX_INFLIGHT
+INFLIGHT = asyncio.Semaphore(MAX_INFLIGHT)
+
+# One worker per in-flight slot; the default executor stops at 32 threads.
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_INFLIGHT, thread_name_prefix="s3")
+
+session = boto3.session.Session(
     aws_access_key_id=env.AWS_ACCESS_KEY_ID,
     aws_secret_access_key=env.AWS_SECRET_ACCESS_KEY,
     region_name=env.AWS_REGION,
 )
 
+# Regions create_bucket may route to: every S3 region botocore knows of, in all
+# partitions, plus the configured one in case it is newer than that list.
+_S3_REGIONS = frozenset(
+    region
+    for partition in session.get_available_partitions()
+    for region in session.get_available_regions("s3", partition_name=partition)
+) | {env.AWS_REGION}
+
+# CreateBucketConfiguration per region, built once. us-east-1 is left out: it is
+# the default location and S3 rejects an explicit constraint for it.
+_BUCKET_CONFIGS = {
+    region: {"LocationConstraint": region}
+    for region in _S3_REGIONS
+    if region != "us-east-1"
+}
+
+CLIENT_CONFIG = Config(
+    # Each worker thread has its own client running one call at a time, so its
+    # pool only needs room for one managed transfer's parts.
+    max_pool_connections=TRANSFER_CONCURRENCY,
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=60,
+    # Adaptive mode keeps its rate limiter per client, so with per-thread
+    # clients a SlowDown would only slow the thread that saw it. Standard mode
+    # still backs off with jitter on throttling errors, and INFLIGHT bounds the
+    # process-wide request rate.
+    retries={"mode": "standard", "max_attempts": 10},
+)
+
+# Clients for other regions are shared by every worker thread, so their pool
+# covers every in-flight call at once.
+REGIONAL_CLIENT_CONFIG = CLIENT_CONFIG.merge(Config(max_pool_connections=MAX_INFLIGHT))
+
+# Clients are thread-safe but serialize signing and endpoint resolution behind
+# internal locks, so each worker thread gets its own client from the shared
+# session. Creating clients from one session is not thread-safe itself.
+_local = threading.local()
+_client_lock = threading.Lock()
+
+
+def get_client() -> "S3Client":
+    """Return the calling thread's S3 client, creating it on first use."""
+    client: Optional["S3Client"] = getattr(_local, "client", None)
+    if client is None:
+        with _client_lock:
+            client = session.client("s3", config=CLIENT_CONFIG)
+        _local.client = client
+    return client
+
+
+# Caller-supplied regions pick the endpoint, so only known ones get a client and
+# the cache holds a handful of them at most.
+@lru_cache(maxsize=8)
+def _regional_client(region: str) -> "S3Client":
+    """Return a shared client for a region other than the configured one."""
+    if region not in _S3_REGIONS:
+        raise ValueError(f"Unknown region: {region}")
+    with _client_lock:
+        return session.client("s3", region_name=region, config=REGIONAL_CLIENT_CONFIG)
+
+
+# Local file transfers go through the AWS Common Runtime, which splits them
+# across many connections from native threads with its own part scheduling.
+# It signs for a single region and does not follow redirects, so buckets
+# elsewhere fall back to the classic transfer manager.
+crt_transfer_manager = CRTTransferManager(
+    create_s3_crt_client(
+        region=env.AWS_REGION,
+        crt_credentials_provider=BotocoreCRTCredentialsWrapper(
+            session.get_credentials()  # type: ignore
+        ).to_crt_credentials_provider(),
+        target_throughput=CRT_TARGET_THROUGHPUT,
+        part_size=64 * MiB,
+    ),
+    BotocoreCRTRequestSerializer(
+        botocore.session.Session(), {"region_name": env.AWS_REGION}
+    ),
+)
+
 app: FastMCP = FastMCP("s3")
 
 
+async def _run(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a blocking boto3 call in a worker thread so the event loop stays free."""
+    loop = asyncio.get_running_loop()
+    async with INFLIGHT:
+        return await loop.run_in_executor(EXECUTOR, partial(func, *args, **kwargs))
+
+
+async def _s3(call: Callable[["S3Client"], T], region: Optional[str] = None) -> T:
+    """Run ``call`` against the worker thread's own client, or one for ``region``."""
+    if region is None or region == env.AWS_REGION:
+        return await _run(lambda: call(get_client()))
+    return await _run(lambda: call(_regional_client(region)))
+
+
+def _client_error(e: ClientError) -> Dict[str, Any]:
+    """Report the S3 error code and message without formatting the exception."""
+    err = e.response["Error"]
+    return {"error": err.get("Code", ""), "message": err.get("Message", "")}
+
+
+def _read_object(bucket_name: str, key: str) -> bytes:
+    """Fetch an object and drain its body; the read is blocking network I/O too."""
+    return get_client().get_object(Bucket=bucket_name, Key=key)["Body"].read()
+
+
+def _read_first_range(
+    bucket_name: str, key: str, chunk_size: int
+) -> Tuple[bytes, int, str]:
+    """Fetch the first chunk, returning it with the object's total size and ETag."""
+    try:
+        response = get_client().get_object(
+            Bucket=bucket_name, Key=key, Range=f"bytes=0-{chunk_size - 1}"
+        )
+    except ClientError as e:
+        # S3 rejects every range on an empty object.
+        if e.response["Error"]["Code"] != "InvalidRange":
+            raise
+        body = _read_object(bucket_name, key)
+        return body, len(body), ""
+    body = response["Body"].read()
+    content_range = response.get("ContentRange")
+    size = int(content_range.rpartition("/")[2]) if content_range else len(body)
+    return body, size, response["ETag"]
+
+
+def _read_range(bucket_name: str, key: str, start: int, end: int, etag: str) -> bytes:
+    """Fetch one inclusive byte range, pinned to the ETag seen by the first GET."""
+    response = get_client().get_object(
+        Bucket=bucket_name, Key=key, Range=f"bytes={start}-{end}", IfMatch=etag
+    )
+    return response["Body"].read()
+
+
+async def _read_ranges(
+    bucket_name: str, key: str, start: int, size: int, etag: str, chunk_size: int
+) -> List[bytes]:
+    """Download the rest of an object from ``start`` as concurrent byte ranges."""
+    gate = asyncio.Semaphore(RANGE_GET_CONCURRENCY)
+
+    async def fetch(offset: int) -> bytes:
+        end = min(offset + chunk_size, size) - 1
+        async with gate:
+            return await _run(_read_range, bucket_name, key, offset, end, etag)
+
+    return await asyncio.gather(*(fetch(i) for i in range(start, size, chunk_size)))
+
+
+@lru_cache(maxsize=4096)
+def _presign(
+    bucket_name: str, key: str, client_method: str, expires_in: int, slot: int
+) -> str:
+    """Sign a URL once per window; ``slot`` only ages out stale entries."""
+    return get_client().generate_presigned_url(
+        ClientMethod=client_method,
+        Params={"Bucket": bucket_name, "Key": key},
+        ExpiresIn=expires_in,
+    )
+
+
+def _upload_file(local_path: str, bucket_name: str, key: str) -> None:
+    """Upload through the CRT, retrying on the classic path for other regions."""
+    try:
+        crt_transfer_manager.upload(local_path, bucket_name, key).result()
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in REGION_MISMATCH_ERRORS:
+            raise
+        get_client().upload_file(local_path, bucket_name, key, Config=TRANSFER_CONFIG)
+
+
+def _download_file(bucket_name: str, key: str, local_path: str) -> None:
+    """Download through the CRT, retrying on the classic path for other regions."""
+    try:
+        crt_transfer_manager.download(bucket_name, key, local_path).result()
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in REGION_MISMATCH_ERRORS:
+            raise
+        get_client().download_file(bucket_name, key, local_path, Config=TRANSFER_CONFIG)
+
+
+def _copy(source_bucket: str, source_key: str, dest_bucket: str, dest_key: str) -> str:
+    """Copy with one CopyObject, or a managed multipart copy past its size limit."""
+    client = get_client()
+    source: "CopySourceTypeDef" = {"Bucket": source_bucket, "Key": source_key}
+    try:
+        response = client.copy_object(
+            CopySource=source, Bucket=dest_bucket, Key=dest_key
+        )
+        return response["CopyObjectResult"]["ETag"]
+    except ClientError as e:
+        # S3 rejects sources over 5 GiB as InvalidRequest.
+        if e.response["Error"]["Code"] != "InvalidRequest":
+            raise
+    client.copy(source, dest_bucket, dest_key, Config=COPY_TRANSFER_CONFIG)
+    # Managed copies return nothing, so read the ETag back from the result.
+    return client.head_object(Bucket=dest_bucket, Key=dest_key)["ETag"]
+
+
+def _delete_batch(
+    bucket_name: str, keys: Sequence[str]
+) -> "DeleteObjectsOutputTypeDef":
+    """Delete one DeleteObjects batch, reporting only the keys that failed."""
+    return get_client().delete_objects(
+        Bucket=bucket_name,
+        Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+    )
+
+
+def _list_objects(
+    bucket_name: str, key_prefix: str, max_keys: Optional[int]
+) -> List[FileEntry]:
+    """Walk every ListObjectsV2 page; later pages reuse the pooled connection."""
+    if max_keys == 0:
+        # The paginator reads MaxItems=0 as no cap; one empty page still
+        # surfaces bucket errors.
+        get_client().list_objects_v2(Bucket=bucket_name, Prefix=key_prefix, MaxKeys=0)
+        return []
+    paginator = get_client().get_paginator("list_objects_v2")
+    # No Delimiter: S3 streams flat key summaries fastest without grouping them.
+    pages = paginator.paginate(
+        Bucket=bucket_name,
+        Prefix=key_prefix,
+        FetchOwner=False,
+        PaginationConfig=(
+            {"PageSize": 1000}
+            if max_keys is None
+            else {"PageSize": 1000, "MaxItems": max_keys}
+        ),
+    )
+    files: List[FileEntry] = []
+    for page in pages:
+        files.extend(
+            {"key": key, "size": size, "last_modified": modified.isoformat()}
+            for key, size, modified in map(_object_fields, page.get("Contents", ()))
+        )
+    return files
+
+
 @app.tool(name="list_buckets", description="List all buckets")
 async def list_buckets(context: Context) -> Dict[str, Union[List[str], str]]:
     """
@@ -27,9 +419,10 @@ async def list_buckets(context: Context) -> Dict[str, Union[List[str], str]]:
         }
     """
     try:
-        response = s3_client.list_buckets()
-        buckets = [bucket["Name"] for bucket in response["Buckets"]]
-        return {"buckets": buckets}
+        response = await _s3(lambda s3: s3.list_buckets())
+        return {"buckets": list(map(_bucket_name, response["Buckets"]))}
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -47,6 +440,10 @@ async def create_bucket(
     """
     Create a new S3 bucket.
 
+    Settings in config are applied after the bucket is created. If one fails,
+    the error is returned and the bucket is left in place with only the
+    settings applied before it.
+
     Args:
         bucket_name (str): The name of the bucket to create.
         region (str): The AWS region where the bucket will be created. Default is "us-west-1".
@@ -61,55 +458,80 @@ async def create_bucket(
             "bucket": "my-new-bucket"
         }
     """
+    if region not in _S3_REGIONS:
+        return {
+            "error": "InvalidLocationConstraint",
+            "message": f"Unknown region: {region}",
+        }
     try:
-        s3_client.create_bucket(
-            Bucket=bucket_name,
-            CreateBucketConfiguration={
-                "LocationConstraint": region if region != "us-east-1" else None  # type: ignore
-            },
-        )
+        create_kwargs: Dict[str, Any] = {"Bucket": bucket_name}
+        if region != "us-east-1":
+            create_kwargs["CreateBucketConfiguration"] = _BUCKET_CONFIGS[region]
+        # CreateBucket must reach the new bucket's own regional endpoint.
+        await _s3(lambda s3: s3.create_bucket(**create_kwargs), region)
 
         if config:
+            # S3 aborts overlapping configuration writes to one bucket with
+            # OperationAborted, which botocore does not retry, so apply the
+            # settings one at a time.
+            settings: List[Callable[["S3Client"], Any]] = []
             if config.get("blockPublicAccess"):
-                s3_client.put_public_access_block(
-                    Bucket=bucket_name,
-                    PublicAccessBlockConfiguration=config["blockPublicAccess"],
+                settings.append(
+                    lambda s3: s3.put_public_access_block(
+                        Bucket=bucket_name,
+                        PublicAccessBlockConfiguration=config["blockPublicAccess"],
+                    )
                 )
             if config.get("versioning"):
-                s3_client.put_bucket_versioning(
-                    Bucket=bucket_name,
-                    VersioningConfiguration={
-                        "Status": "Enabled" if config["versioning"] else "Suspended"
-                    },
+                settings.append(
+                    lambda s3: s3.put_bucket_versioning(
+                        Bucket=bucket_name,
+                        VersioningConfiguration={
+                            "Status": "Enabled" if config["versioning"] else "Suspended"
+                        },
+                    )
                 )
             if config.get("encryption"):
-                s3_client.put_bucket_encryption(
-                    Bucket=bucket_name,
-                    ServerSideEncryptionConfiguration={
-                        "Rules": [
-                            {
-                                "ApplyServerSideEncryptionByDefault": {
-                                    "SSEAlgorithm": config["encryption"]
+                settings.append(
+                    lambda s3: s3.put_bucket_encryption(
+                        Bucket=bucket_name,
+                        ServerSideEncryptionConfiguration={
+                            "Rules": [
+                                {
+                                    "ApplyServerSideEncryptionByDefault": {
+                                        "SSEAlgorithm": config["encryption"]
+                                    }
                                 }
-                            }
-                        ]
-                    },
+                            ]
+                        },
+                    )
                 )
+            for apply in settings:
+                await _s3(apply, region)
         return {"success": True, "bucket": bucket_name}
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
 
 @app.tool(name="list_bucket", description="List objects in a bucket")
 async def list_bucket(
-    context: Context, bucket_name: str, key_prefix: str = ""
-) -> Dict[str, Union[str, List[Dict[str, Any]]]]:
+    context: Context,
+    bucket_name: str,
+    key_prefix: str = "",
+    max_keys: Optional[int] = None,
+) -> Union[ListBucketResponse, Dict[str, str]]:
     """
-    List objects in a specified S3 bucket.
+    List objects in a specified S3 bucket, following pagination past 1000 keys.
+
+    Keys are listed flat, without a delimiter. Folder-style listings of common
+    prefixes should get their own tool rather than a delimiter option here.
 
     Args:
         bucket_name (str): The name of the bucket.
         key_prefix (str): Optional prefix to filter the objects.
+        max_keys (Optional[int]): Optional cap on the number of keys returned; 0 returns none. Default lists every key.
 
     Returns:
         A dictionary containing the bucket name and a list of files or an error message.
@@ -123,33 +545,31 @@ async def list_bucket(
             ]
         }
     """
+    if max_keys is not None and max_keys < 0:
+        return {"error": "InvalidArgument", "message": "max_keys must not be negative"}
     try:
-        response = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=key_prefix)
-        files = []
-        if "Contents" in response:
-            for obj in response["Contents"]:
-                files.append(
-                    {
-                        "key": obj["Key"],
-                        "size": obj["Size"],
-                        "last_modified": obj["LastModified"].isoformat(),
-                    }
-                )
+        files = await _run(_list_objects, bucket_name, key_prefix, max_keys)
         return {"bucket": bucket_name, "files": files}
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
 
 @app.tool(name="get_object", description="Get an object from a bucket")
 async def get_object(
-    context: Context, bucket_name: str, key: str
+    context: Context, bucket_name: str, key: str, chunk_size: int = 8 * MiB
 ) -> Union[str, Dict[str, str]]:
     """
     Retrieve an object from a specified S3 bucket.
 
+    The first chunk_size bytes come from a single ranged GET; any remainder of
+    a larger object is fetched as concurrent ranged GETs.
+
     Args:
         bucket_name (str): The name of the bucket.
         key (str): The key of the object to retrieve.
+        chunk_size (int): Size in bytes of each ranged GET, greater than zero. Default is 8 MiB.
 
     Returns:
         The content of the object or an error message.
@@ -157,9 +577,19 @@ async def get_object(
     Example:
         "This is the content of the object."
     """
+    if chunk_size <= 0:
+        return {
+            "error": "InvalidArgument",
+            "message": "chunk_size must be greater than zero",
+        }
     try:
-        response = s3_client.get_object(Bucket=bucket_name, Key=key)
-        return response["Body"].read().decode("utf-8")
+        first, size, etag = await _run(_read_first_range, bucket_name, key, chunk_size)
+        if size <= len(first):
+            return first.decode("utf-8")
+        rest = await _read_ranges(bucket_name, key, len(first), size, etag, chunk_size)
+        return b"".join([first, *rest]).decode("utf-8")
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -185,8 +615,10 @@ async def put_object(
         }
     """
     try:
-        s3_client.put_object(Bucket=bucket_name, Key=key, Body=body)
-        return {"success": True}
+        await _s3(lambda s3: s3.put_object(Bucket=bucket_name, Key=key, Body=body))
+        return _OK
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -212,8 +644,10 @@ async def upload_local_file(
         }
     """
     try:
-        s3_client.upload_file(local_path, bucket_name, key)
-        return {"success": True}
+        await _run(_upload_file, local_path, bucket_name, key)
+        return _OK
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -242,8 +676,10 @@ async def download_file_to_local(
         }
     """
     try:
-        s3_client.download_file(bucket_name, key, local_path)
-        return {"success": True}
+        await _run(_download_file, bucket_name, key, local_path)
+        return _OK
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -268,8 +704,57 @@ async def delete_object(
         }
     """
     try:
-        s3_client.delete_object(Bucket=bucket_name, Key=key)
-        return {"success": True}
+        await _s3(lambda s3: s3.delete_object(Bucket=bucket_name, Key=key))
+        return _OK
+    except ClientError as e:
+        return _client_error(e)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@app.tool(
+    name="delete_objects",
+    description="Delete many objects from a bucket in batched requests",
+)
+async def delete_objects(
+    context: Context, bucket_name: str, keys: List[str]
+) -> Dict[str, Union[bool, str, List[Dict[str, str]]]]:
+    """
+    Delete multiple objects from a specified S3 bucket.
+
+    Keys are sent in batches of up to 1000 per DeleteObjects request, and the
+    batches run concurrently.
+
+    Args:
+        bucket_name (str): The name of the bucket.
+        keys (List[str]): The keys of the objects to delete.
+
+    Returns:
+        A dictionary indicating success, with any per-key failures, or an error message.
+
+    Example:
+        {
+            "success": False,
+            "errors": [
+                {"Key": "file1.txt", "Code": "AccessDenied", "Message": "Access Denied"}
+            ]
+        }
+    """
+    try:
+        responses = await asyncio.gather(
+            *(
+                _run(_delete_batch, bucket_name, batch)
+                for batch in batched(keys, DELETE_BATCH_SIZE)
+            )
+        )
+        errors: List[Dict[str, str]] = [
+            {"Key": err["Key"], "Code": err["Code"], "Message": err["Message"]}
+            for response in responses
+            for err in response.get("Errors", [])
+        ]
+        return {"success": not errors, "errors": errors}
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -288,6 +773,9 @@ async def generate_presigned_url(
     """
     Generate a presigned URL for accessing or uploading an object.
 
+    URLs are cached for up to a minute, so one may expire up to 60 seconds
+    earlier than requested.
+
     Args:
         bucket_name (str): The name of the bucket.
         key (str): The key of the object.
@@ -304,12 +792,17 @@ async def generate_presigned_url(
         }
     """
     try:
-        url = s3_client.generate_presigned_url(
-            ClientMethod="get_object" if http_method.upper() == "GET" else "put_object",
-            Params={"Bucket": bucket_name, "Key": key},
-            ExpiresIn=expires_in,
+        # Signing is pure CPU with static credentials, cheaper than a thread hop.
+        url = _presign(
+            bucket_name,
+            key,
+            "get_object" if http_method.upper() == "GET" else "put_object",
+            (expires_in + PRESIGN_WINDOW - 1) // PRESIGN_WINDOW * PRESIGN_WINDOW,
+            int(time.time()) // PRESIGN_WINDOW,
         )
         return {"success": True, "url": url}
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -334,8 +827,13 @@ async def put_bucket_policy(
         }
     """
     try:
-        s3_client.put_bucket_policy(Bucket=bucket_name, Policy=policy_json)
-        return {"success": True}
+        # Round-tripping rejects malformed JSON before the request and sends the
+        # policy in compact form.
+        policy = orjson.dumps(orjson.loads(policy_json)).decode()
+        await _s3(lambda s3: s3.put_bucket_policy(Bucket=bucket_name, Policy=policy))
+        return _OK
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -343,7 +841,7 @@ async def put_bucket_policy(
 @app.tool(name="get_bucket_policy", description="Retrieve the current bucket policy")
 async def get_bucket_policy(
     context: Context, bucket_name: str
-) -> Dict[str, Union[bool, str]]:
+) -> Dict[str, Union[bool, str, Dict[str, Any]]]:
     """
     Retrieve the current policy for a specified S3 bucket.
 
@@ -356,12 +854,14 @@ async def get_bucket_policy(
     Example:
         {
             "success": True,
-            "policy": "policy-json-string"
+            "policy": {"Version": "2012-10-17", "Statement": [...]}
         }
     """
     try:
-        response = s3_client.get_bucket_policy(Bucket=bucket_name)
-        return {"success": True, "policy": response["Policy"]}
+        response = await _s3(lambda s3: s3.get_bucket_policy(Bucket=bucket_name))
+        return {"success": True, "policy": orjson.loads(response["Policy"])}
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -385,8 +885,10 @@ async def delete_bucket_policy(
         }
     """
     try:
-        s3_client.delete_bucket_policy(Bucket=bucket_name)
-        return {"success": True}
+        await _s3(lambda s3: s3.delete_bucket_policy(Bucket=bucket_name))
+        return _OK
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -410,8 +912,10 @@ async def delete_bucket(
         }
     """
     try:
-        s3_client.delete_bucket(Bucket=bucket_name)
-        return {"success": True}
+        await _s3(lambda s3: s3.delete_bucket(Bucket=bucket_name))
+        return _OK
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -427,6 +931,10 @@ async def copy_object(
     """
     Copy an object from one location to another within S3.
 
+    Objects above CopyObject's 5 GiB limit are copied server-side as parallel
+    UploadPartCopy parts. Those copies do not carry over the source's content
+    type, metadata or tags.
+
     Args:
         source_bucket (str): Source bucket name
         source_key (str): Source object key
@@ -443,12 +951,10 @@ async def copy_object(
         }
     """
     try:
-        response = s3_client.copy_object(
-            CopySource={"Bucket": source_bucket, "Key": source_key},
-            Bucket=dest_bucket,
-            Key=dest_key,
-        )
-        return {"success": True, "copy_id": response["CopyObjectResult"]["ETag"]}
+        etag = await _run(_copy, source_bucket, source_key, dest_bucket, dest_key)
+        return {"success": True, "copy_id": etag}
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -456,7 +962,7 @@ async def copy_object(
 @app.tool(name="get_bucket_lifecycle", description="Get bucket lifecycle configuration")
 async def get_bucket_lifecycle(
     context: Context, bucket_name: str
-) -> Dict[str, Union[List[Dict[str, Any]], str]]:
+) -> Dict[str, Union[Sequence[Mapping[str, Any]], str]]:
     """
     Get the lifecycle configuration of a bucket.
 
@@ -478,10 +984,12 @@ async def get_bucket_lifecycle(
         }
     """
     try:
-        response = s3_client.get_bucket_lifecycle_configuration(Bucket=bucket_name)
-        # Convert LifecycleRuleOutputTypeDef to Dict[str, Any]
-        rules = [{k: v for k, v in rule.items()} for rule in response["Rules"]]
-        return {"rules": rules}
+        response = await _s3(
+            lambda s3: s3.get_bucket_lifecycle_configuration(Bucket=bucket_name)
+        )
+        return {"rules": response["Rules"]}
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -506,27 +1014,22 @@ async def put_bucket_lifecycle(
         }
     """
     try:
-        formatted_rules = []
-        for rule in lifecycle_config:
-            formatted_rule = {
-                "ID": rule.get("ID"),
-                "Status": rule.get("Status"),
-                "Transitions": rule.get("Transitions", []),
-                "Expiration": rule.get("Expiration"),
-                "NoncurrentVersionExpiration": rule.get("NoncurrentVersionExpiration"),
-                "NoncurrentVersionTransitions": rule.get(
-                    "NoncurrentVersionTransitions", []
-                ),
-            }
-            formatted_rules.append(formatted_rule)
-
-        s3_client.put_bucket_lifecycle_configuration(
-            Bucket=bucket_name,
-            LifecycleConfiguration={
-                "Rules": formatted_rules  # type: ignore
-            },
+        formatted_rules = [
+            {k: rule[k] for k in LIFECYCLE_RULE_KEYS if k in rule}
+            for rule in lifecycle_config
+        ]
+
+        await _s3(
+            lambda s3: s3.put_bucket_lifecycle_configuration(
+                Bucket=bucket_name,
+                LifecycleConfiguration={
+                    "Rules": formatted_rules  # type: ignore
+                },
+            )
         )
-        return {"success": True}
+        return _OK
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -534,7 +1037,7 @@ async def put_bucket_lifecycle(
 @app.tool(name="get_object_tagging", description="Get object tags")
 async def get_object_tagging(
     context: Context, bucket_name: str, key: str
-) -> Dict[str, Union[List[Dict[str, str]], str]]:
+) -> Dict[str, Union[Sequence[Mapping[str, Any]], str]]:
     """
     Get tags for an S3 object.
 
@@ -554,11 +1057,12 @@ async def get_object_tagging(
         }
     """
     try:
-        response = s3_client.get_object_tagging(Bucket=bucket_name, Key=key)
-        tags = [
-            {"Key": tag["Key"], "Value": tag["Value"]} for tag in response["TagSet"]
-        ]
-        return {"tags": tags}
+        response = await _s3(
+            lambda s3: s3.get_object_tagging(Bucket=bucket_name, Key=key)
+        )
+        return {"tags": response["TagSet"]}
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -584,14 +1088,16 @@ async def put_object_tagging(
         }
     """
     try:
-        formatted_tags = [{"Key": tag["Key"], "Value": tag["Value"]} for tag in tags]
-
-        s3_client.put_object_tagging(
-            Bucket=bucket_name,
-            Key=key,
-            Tagging={"TagSet": formatted_tags},  # type: ignore
+        await _s3(
+            lambda s3: s3.put_object_tagging(
+                Bucket=bucket_name,
+                Key=key,
+                Tagging={"TagSet": tags},  # type: ignore
+            )
         )
-        return {"success": True}
+        return _OK
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 
@@ -599,7 +1105,7 @@ async def put_object_tagging(
 @app.tool(name="get_bucket_cors", description="Get bucket CORS configuration")
 async def get_bucket_cors(
     context: Context, bucket_name: str
-) -> Dict[str, Union[List[Dict[str, Any]], str]]:
+) -> Dict[str, Union[Sequence[Mapping[str, Any]], str]]:
     """
     Get CORS configuration for a bucket.
 
@@ -622,9 +1128,10 @@ async def get_bucket_cors(
         }
     """
     try:
-        response = s3_client.get_bucket_cors(Bucket=bucket_name)
-        cors_rules = [{k: v for k, v in rule.items()} for rule in response["CORSRules"]]
-        return {"cors_rules": cors_rules}
+        response = await _s3(lambda s3: s3.get_bucket_cors(Bucket=bucket_name))
+        return {"cors_rules": response["CORSRules"]}
+    except ClientError as e:
+        return _client_error(e)
     except Exception as e:
         return {"error": str(e)}
 